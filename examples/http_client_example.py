@@ -2,148 +2,186 @@
 
 import asyncio
 import json
-import requests
 from typing import Dict, Any, List
 import httpx
 
+# Gateway errors retried by _get_json, with exponential backoff between attempts
+RETRY_STATUSES = frozenset({502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2
+
 class MLBInjuryAPIClient:
     """Client for the MLB Injury Scraper HTTP API."""
     
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        
+        # One persistent async client shared by every call so requests reuse
+        # pooled keep-alive connections; the transport retries failed connects and
+        # _get_json retries gateway errors
+        self._async_client = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(retries=3)
+        )
     
-    def health_check(self) -> Dict[str, Any]:
-        """Check if the API is healthy."""
-        response = self.session.get(f"{self.base_url}/health")
+    async def close(self):
+        """Close the underlying HTTP client."""
+        await self._async_client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _get_json(self, path: str) -> Dict[str, Any]:
+        """GET a path on the API and decode the JSON body."""
+        for attempt in range(MAX_RETRIES + 1):
+            response = await self._async_client.get(path)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
         response.raise_for_status()
         return response.json()
     
-    def get_available_teams(self) -> Dict[str, Any]:
+    async def health_check(self) -> Dict[str, Any]:
+        """Check if the API is healthy."""
+        return await self._get_json("/health")
+    
+    async def get_available_teams(self) -> Dict[str, Any]:
         """Get all available teams."""
-        response = self.session.get(f"{self.base_url}/api/teams")
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json("/api/teams")
     
-    def get_team_injuries(self, team: str) -> Dict[str, Any]:
+    async def get_team_injuries(self, team: str) -> Dict[str, Any]:
         """Get injuries for a specific team."""
-        response = self.session.get(f"{self.base_url}/api/teams/{team}/injuries")
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(f"/api/teams/{team}/injuries")
     
-    def get_injury_summary(self, team: str) -> Dict[str, Any]:
+    async def get_injury_summary(self, team: str) -> Dict[str, Any]:
         """Get injury summary for a team."""
-        response = self.session.get(f"{self.base_url}/api/teams/{team}/summary")
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(f"/api/teams/{team}/summary")
     
-    def search_player(self, team: str, player_name: str) -> Dict[str, Any]:
+    async def search_player(self, team: str, player_name: str) -> Dict[str, Any]:
         """Search for a player on a team."""
-        response = self.session.get(f"{self.base_url}/api/teams/{team}/players/{player_name}")
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(f"/api/teams/{team}/players/{player_name}")
     
     async def stream_team_injuries(self, team: str, interval: int = 30):
         """Stream real-time injury updates via SSE."""
-        async with httpx.AsyncClient() as client:
-            url = f"{self.base_url}/api/teams/{team}/injuries/stream?interval={interval}"
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]  # Remove "data: " prefix
-                        try:
-                            yield json.loads(data)
-                        except json.JSONDecodeError:
-                            continue
+        url = f"/api/teams/{team}/injuries/stream?interval={interval}"
+        async with self._async_client.stream("GET", url, timeout=None) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]  # Remove "data: " prefix
+                    try:
+                        yield json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
 
-def main():
+async def main():
     """Example usage of the MLB Injury API client."""
-    client = MLBInjuryAPIClient()
-    
     print("🏥 MLB Injury Scraper API Client Example")
     print("=" * 50)
     
-    try:
-        # Health check
-        print("\n1. Health Check:")
-        health = client.health_check()
-        print(f"   Status: {health['status']}")
-        
-        # Get available teams
-        print("\n2. Available Teams:")
-        teams_data = client.get_available_teams()
-        print(f"   Total teams: {teams_data['total_teams']}")
-        print("   Sample teams:")
-        for team_key, team_info in list(teams_data['teams'].items())[:5]:
-            print(f"     - {team_key}: {team_info['name']} ({team_info['abbreviation']})")
-        
-        # Test with specific teams
-        test_teams = ['mets', 'dodgers', 'yankees']
-        
-        for team in test_teams:
-            print(f"\n3. {team.upper()} Injuries:")
-            try:
-                injuries = client.get_team_injuries(team)
-                print(f"   Team: {injuries['team_name']}")
-                print(f"   Total injured: {injuries['total_injured']}")
-                
-                if injuries['players']:
-                    print("   Recent injuries:")
-                    for player in injuries['players'][:3]:  # Show first 3
-                        print(f"     - {player['name']} ({player['position']}): {player['injury']}")
-                
-                # Get summary
-                summary = client.get_injury_summary(team)
-                print(f"   Injury types: {len(summary['injury_type_breakdown'])}")
-                
-            except requests.exceptions.HTTPError as e:
-                print(f"   Error: {e}")
-        
-        # Search for a player
-        print("\n4. Player Search Example:")
+    # Test with specific teams
+    test_teams = ['mets', 'dodgers', 'yankees']
+    
+    async with MLBInjuryAPIClient() as client:
         try:
-            search_result = client.search_player('mets', 'Pete')
-            if search_result['found']:
-                player = search_result['player']
-                print(f"   Found: {player['name']} - {player['injury']}")
-            else:
-                print(f"   {search_result['message']}")
-        except requests.exceptions.HTTPError as e:
-            print(f"   Search error: {e}")
-        
-        print("\n5. SSE Stream Example:")
-        print("   To test real-time streaming, run:")
-        print("   python -c \"import asyncio; from examples.http_client_example import stream_example; asyncio.run(stream_example())\"")
-        
-    except requests.exceptions.ConnectionError:
-        print("❌ Could not connect to the API server.")
-        print("   Make sure the server is running with: python server.py --http")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+            # The calls are independent, so issue them all concurrently
+            health, teams_data, *results = await asyncio.gather(
+                client.health_check(),
+                client.get_available_teams(),
+                *[client.get_team_injuries(team) for team in test_teams],
+                *[client.get_injury_summary(team) for team in test_teams],
+                client.search_player('mets', 'Pete'),
+                return_exceptions=True
+            )
+            injuries_results = results[:len(test_teams)]
+            summary_results = results[len(test_teams):2 * len(test_teams)]
+            search_result = results[-1]
+            
+            # Health check
+            print("\n1. Health Check:")
+            if isinstance(health, Exception):
+                raise health
+            print(f"   Status: {health['status']}")
+            
+            # Get available teams
+            print("\n2. Available Teams:")
+            if isinstance(teams_data, Exception):
+                raise teams_data
+            print(f"   Total teams: {teams_data['total_teams']}")
+            print("   Sample teams:")
+            for team_key, team_info in list(teams_data['teams'].items())[:5]:
+                print(f"     - {team_key}: {team_info['name']} ({team_info['abbreviation']})")
+            
+            for team, injuries, summary in zip(test_teams, injuries_results, summary_results):
+                print(f"\n3. {team.upper()} Injuries:")
+                try:
+                    if isinstance(injuries, Exception):
+                        raise injuries
+                    print(f"   Team: {injuries['team_name']}")
+                    print(f"   Total injured: {injuries['total_injured']}")
+                    
+                    if injuries['players']:
+                        print("   Recent injuries:")
+                        for player in injuries['players'][:3]:  # Show first 3
+                            print(f"     - {player['name']} ({player['position']}): {player['injury']}")
+                    
+                    # Get summary
+                    if isinstance(summary, Exception):
+                        raise summary
+                    print(f"   Injury types: {len(summary['injury_type_breakdown'])}")
+                    
+                except httpx.HTTPStatusError as e:
+                    print(f"   Error: {e}")
+            
+            # Search for a player
+            print("\n4. Player Search Example:")
+            try:
+                if isinstance(search_result, Exception):
+                    raise search_result
+                if search_result['found']:
+                    player = search_result['player']
+                    print(f"   Found: {player['name']} - {player['injury']}")
+                else:
+                    print(f"   {search_result['message']}")
+            except httpx.HTTPStatusError as e:
+                print(f"   Search error: {e}")
+            
+            print("\n5. SSE Stream Example:")
+            print("   To test real-time streaming, run:")
+            print("   python -c \"import asyncio; from examples.http_client_example import stream_example; asyncio.run(stream_example())\"")
+            
+        except httpx.ConnectError:
+            print("❌ Could not connect to the API server.")
+            print("   Make sure the server is running with: python server.py --http")
+        except Exception as e:
+            print(f"❌ Error: {e}")
 
 async def stream_example():
     """Example of streaming real-time updates."""
-    client = MLBInjuryAPIClient()
-    
-    print("🔄 Streaming Mets injuries (press Ctrl+C to stop)...")
-    try:
-        count = 0
-        async for update in client.stream_team_injuries('mets', interval=10):
-            count += 1
-            print(f"\n📡 Update #{count}:")
-            print(f"   Team: {update['team_name']}")
-            print(f"   Total injured: {update['total_injured']}")
-            print(f"   Timestamp: {update['timestamp']}")
-            
-            if count >= 3:  # Stop after 3 updates for demo
-                print("\n✅ Demo complete!")
-                break
+    async with MLBInjuryAPIClient() as client:
+        print("🔄 Streaming Mets injuries (press Ctrl+C to stop)...")
+        try:
+            count = 0
+            async for update in client.stream_team_injuries('mets', interval=10):
+                count += 1
+                print(f"\n📡 Update #{count}:")
+                print(f"   Team: {update['team_name']}")
+                print(f"   Total injured: {update['total_injured']}")
+                print(f"   Timestamp: {update['timestamp']}")
                 
-    except KeyboardInterrupt:
-        print("\n🛑 Streaming stopped by user")
-    except Exception as e:
-        print(f"❌ Streaming error: {e}")
+                if count >= 3:  # Stop after 3 updates for demo
+                    print("\n✅ Demo complete!")
+                    break
+                    
+        except KeyboardInterrupt:
+            print("\n🛑 Streaming stopped by user")
+        except Exception as e:
+            print(f"❌ Streaming error: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -1,35 +1,159 @@
 """HTTP/REST API server for MLB injury data with SSE support."""
 
 import asyncio
-import json
+import hashlib
 import logging
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
+import orjson
 import uvicorn
 from sse_starlette.sse import EventSourceResponse
 
 from scraper import MLBInjuryScraper, InjuredPlayer
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging; INFO is opt-in via --verbose (propagated to workers by env var)
+VERBOSE_ENV_VAR = "MLB_INJURY_VERBOSE"
+logging.basicConfig(level=logging.INFO if os.environ.get(VERBOSE_ENV_VAR) else logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Opt-in number of uvicorn worker processes (default 1)
+WORKERS_ENV_VAR = "MLB_INJURY_WORKERS"
+
 # Global scraper instance
 scraper: Optional[MLBInjuryScraper] = None
 
+# Worker threads available for blocking scraper calls
+SCRAPER_MAX_WORKERS = 16
+
+# Seconds a scraped injury list is served from memory before re-scraping
+INJURY_CACHE_TTL = 60
+
+# Per-team cache of (scraped_at, players, name_index) and locks that coalesce
+# concurrent scrapes. name_index maps lowercased player names to players, in
+# page order, so searches never re-lower names.
+_injury_cache: Dict[str, tuple[float, List[InjuredPlayer], Dict[str, InjuredPlayer]]] = {}
+_locks: Dict[str, asyncio.Lock] = {}
+# Error responses must not be kept by clients or proxies
+_NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+def _build_name_index(injured_players: List[InjuredPlayer]) -> Dict[str, InjuredPlayer]:
+    """Index players by lowercased name, keeping the first player for duplicates."""
+    name_index = {}
+    for player in injured_players:
+        name_index.setdefault(player.name.lower(), player)
+    return name_index
+
+async def _get_cache_entry(team: str, ttl: int = INJURY_CACHE_TTL):
+    """Get the cache entry for a team, scraping at most once per TTL window."""
+    entry = _injury_cache.get(team)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry
+    
+    lock = _locks.setdefault(team, asyncio.Lock())
+    async with lock:
+        # Another request may have refreshed the entry while we waited
+        entry = _injury_cache.get(team)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry
+        
+        loop = asyncio.get_running_loop()
+        try:
+            injured_players = await loop.run_in_executor(
+                app.state.executor, scraper.fetch_team_injuries, team
+            )
+        except Exception as e:
+            # Never cache a failed scrape; the error must not look like an empty report
+            logger.error("Error scraping %s injuries: %s", team, e)
+            raise HTTPException(
+                status_code=502,
+                detail=f"Failed to scrape injury data for {team}: {str(e)}",
+                headers=_NO_STORE_HEADERS
+            )
+        entry = (time.monotonic(), injured_players, _build_name_index(injured_players))
+        _injury_cache[team] = entry
+        return entry
+
+async def get_cached_injuries(team: str, ttl: int = INJURY_CACHE_TTL) -> List[InjuredPlayer]:
+    """Get injured players for a team, scraping at most once per TTL window."""
+    entry = await _get_cache_entry(team, ttl)
+    return entry[1]
+
+# Encoded response bodies keyed by (endpoint, team): (scraped_at, payload, etag).
+# An entry is reused for as long as it was built from the current scrape.
+_response_cache: Dict[tuple[str, str], tuple[float, bytes, str]] = {}
+
+def _conditional_json_response(request: Request, key: tuple[str, str], scraped_at: float,
+                               build_payload, ttl: int = INJURY_CACHE_TTL) -> Response:
+    """Return a cached JSON body with ETag/Cache-Control, or 304 if the client has it."""
+    cached = _response_cache.get(key)
+    if cached is None or cached[0] != scraped_at:
+        payload = orjson.dumps(build_payload())
+        etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+        cached = (scraped_at, payload, etag)
+        _response_cache[key] = cached
+    
+    _, payload, etag = cached
+    max_age = max(0, int(ttl - (time.monotonic() - scraped_at)))
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(payload, media_type="application/json", headers=headers)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup the scraper."""
     global scraper
-    scraper = MLBInjuryScraper()
+    # _injury_cache owns freshness; the scraper only revalidates unchanged pages
+    scraper = MLBInjuryScraper(cache_ttl=0)
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=SCRAPER_MAX_WORKERS, thread_name_prefix="scraper"
+    )
+    
+    # Team configuration is static for the process lifetime, so build it once
+    app.state.available_teams = frozenset(scraper.get_available_teams())
+    app.state.available_teams_csv = ', '.join(scraper.get_available_teams())
+    app.state.team_info = {
+        team_key: scraper.get_team_info(team_key)
+        for team_key in scraper.get_available_teams()
+    }
+    app.state.teams_response = AvailableTeamsResponse(
+        total_teams=len(app.state.available_teams),
+        teams={
+            team_key: {
+                "name": info.get('name', team_key),
+                "abbreviation": info.get('abbreviation', team_key.upper())
+            }
+            for team_key, info in app.state.team_info.items()
+            if info
+        }
+    )
+    app.state.teams_response_bytes = orjson.dumps(app.state.teams_response.model_dump())
     logger.info("MLB Injury Scraper HTTP server started")
-    yield
-    logger.info("MLB Injury Scraper HTTP server shutting down")
+    try:
+        yield
+    finally:
+        logger.info("MLB Injury Scraper HTTP server shutting down")
+        # Stop the SSE producers before the executor they scrape on goes away
+        producers = list(_producers.values())
+        for task in producers:
+            task.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
+        _producers.clear()
+        _subscribers.clear()
+        _last_frame.clear()
+        app.state.executor.shutdown(wait=False, cancel_futures=True)
 
 # Create FastAPI app
 app = FastAPI(
@@ -48,6 +172,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON bodies large enough to benefit (the teams list, injury reports);
+# starlette>=0.46 leaves text/event-stream uncompressed so SSE frames aren't buffered
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Pydantic models for request/response
 class InjuredPlayerResponse(BaseModel):
     name: str
@@ -86,216 +214,261 @@ async def health_check():
     return {"status": "healthy", "service": "mlb-injury-scraper"}
 
 # Get available teams
-@app.get("/api/teams", response_model=AvailableTeamsResponse)
+@app.get("/api/teams", responses={200: {"model": AvailableTeamsResponse}})
 async def get_available_teams():
     """Get list of all available MLB teams."""
-    try:
-        teams = scraper.get_available_teams()
-        team_info = {}
-        
-        for team_key in teams:
-            info = scraper.get_team_info(team_key)
-            if info:
-                team_info[team_key] = {
-                    "name": info.get('name', team_key),
-                    "abbreviation": info.get('abbreviation', team_key.upper())
-                }
-        
-        return AvailableTeamsResponse(
-            total_teams=len(teams),
-            teams=team_info
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting available teams: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve team list: {str(e)}")
+    # The team list never changes at runtime, so serve the pre-encoded body
+    return Response(app.state.teams_response_bytes, media_type="application/json")
 
 # Get team injuries
-@app.get("/api/teams/{team}/injuries", response_model=TeamInjuriesResponse)
-async def get_team_injuries(team: str):
+@app.get("/api/teams/{team}/injuries", responses={200: {"model": TeamInjuriesResponse}})
+async def get_team_injuries(team: str, request: Request):
     """Get current injury report for a specific MLB team."""
     try:
         # Validate team exists
-        available_teams = scraper.get_available_teams()
-        if team.lower() not in available_teams:
+        if team.lower() not in app.state.available_teams:
             raise HTTPException(
                 status_code=404, 
-                detail=f"Team '{team}' not supported. Available teams: {', '.join(available_teams)}"
+                detail=f"Team '{team}' not supported. Available teams: {app.state.available_teams_csv}"
             )
         
-        team_info = scraper.get_team_info(team.lower())
-        injured_players = scraper.scrape_team_injuries(team.lower())
+        team_info = app.state.team_info.get(team.lower())
+        scraped_at, injured_players, _ = await _get_cache_entry(team.lower())
         
-        players = [
-            InjuredPlayerResponse(
-                name=player.name,
-                position=player.position,
-                injury=player.injury,
-                il_date=player.il_date,
-                expected_return=player.expected_return,
-                status=player.status,
-                last_updated=player.last_updated
-            )
-            for player in injured_players
-        ]
+        def build_payload():
+            # orjson serializes the InjuredPlayer dataclasses directly, so no
+            # per-player model or dict is built
+            return {
+                "team": team.lower(),
+                "team_name": team_info.get('name', team) if team_info else team,
+                "total_injured": len(injured_players),
+                "players": injured_players
+            }
         
-        return TeamInjuriesResponse(
-            team=team.lower(),
-            team_name=team_info.get('name', team) if team_info else team,
-            total_injured=len(players),
-            players=players
+        return _conditional_json_response(
+            request, ("injuries", team.lower()), scraped_at, build_payload
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting {team} injuries: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve injury data for {team}: {str(e)}")
+        logger.error("Error getting %s injuries: %s", team, e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve injury data for {team}: {str(e)}",
+            headers=_NO_STORE_HEADERS
+        )
 
 # Get injury summary
-@app.get("/api/teams/{team}/summary", response_model=InjurySummaryResponse)
-async def get_injury_summary(team: str):
+@app.get("/api/teams/{team}/summary", responses={200: {"model": InjurySummaryResponse}})
+async def get_injury_summary(team: str, request: Request):
     """Get injury summary for a specific team."""
     try:
         # Validate team exists
-        available_teams = scraper.get_available_teams()
-        if team.lower() not in available_teams:
+        if team.lower() not in app.state.available_teams:
             raise HTTPException(
                 status_code=404, 
-                detail=f"Team '{team}' not supported. Available teams: {', '.join(available_teams)}"
+                detail=f"Team '{team}' not supported. Available teams: {app.state.available_teams_csv}"
             )
         
-        injured_players = scraper.scrape_team_injuries(team.lower())
-        
-        total_injured = len(injured_players)
-        injury_types = {}
+        scraped_at, injured_players, _ = await _get_cache_entry(team.lower())
         
-        for player in injured_players:
-            injury_type = player.injury
-            injury_types[injury_type] = injury_types.get(injury_type, 0) + 1
+        def build_payload():
+            total_injured = len(injured_players)
+            injury_types = dict(Counter(player.injury for player in injured_players))
+            return {
+                "team": team.lower(),
+                "total_injured_players": total_injured,
+                "injury_type_breakdown": injury_types,
+                "last_updated": "Real-time data from MLB.com"
+            }
         
-        return InjurySummaryResponse(
-            team=team.lower(),
-            total_injured_players=total_injured,
-            injury_type_breakdown=injury_types,
-            last_updated="Real-time data from MLB.com"
+        return _conditional_json_response(
+            request, ("summary", team.lower()), scraped_at, build_payload
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting injury summary for {team}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve injury summary for {team}: {str(e)}")
+        logger.error("Error getting injury summary for %s: %s", team, e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve injury summary for {team}: {str(e)}",
+            headers=_NO_STORE_HEADERS
+        )
 
 # Search for player
-@app.get("/api/teams/{team}/players/{player_name}", response_model=PlayerSearchResponse)
+@app.get("/api/teams/{team}/players/{player_name}", responses={200: {"model": PlayerSearchResponse}})
 async def search_player_injury(team: str, player_name: str):
     """Search for a specific player's injury status on a team."""
     try:
         # Validate team exists
-        available_teams = scraper.get_available_teams()
-        if team.lower() not in available_teams:
+        if team.lower() not in app.state.available_teams:
             raise HTTPException(
                 status_code=404, 
-                detail=f"Team '{team}' not supported. Available teams: {', '.join(available_teams)}"
+                detail=f"Team '{team}' not supported. Available teams: {app.state.available_teams_csv}"
             )
         
-        injured_players = scraper.scrape_team_injuries(team.lower())
+        _, _, name_index = await _get_cache_entry(team.lower())
         
-        # Search for player (case-insensitive)
+        # Search for player (case-insensitive): exact name first, then substring
         player_name_lower = player_name.lower()
-        for player in injured_players:
-            if player_name_lower in player.name.lower():
-                return PlayerSearchResponse(
-                    found=True,
-                    player=InjuredPlayerResponse(
-                        name=player.name,
-                        position=player.position,
-                        injury=player.injury,
-                        il_date=player.il_date,
-                        expected_return=player.expected_return,
-                        status=player.status,
-                        last_updated=player.last_updated
-                    )
-                )
+        player = name_index.get(player_name_lower)
+        if player is None:
+            player = next(
+                (p for lname, p in name_index.items() if player_name_lower in lname),
+                None
+            )
         
-        return PlayerSearchResponse(
-            found=False,
-            message=f"No injury information found for player: {player_name} on team: {team}"
-        )
+        if player is not None:
+            return Response(orjson.dumps({
+                "found": True,
+                "player": player,
+                "message": None
+            }), media_type="application/json")
+        
+        return Response(orjson.dumps({
+            "found": False,
+            "player": None,
+            "message": f"No injury information found for player: {player_name} on team: {team}"
+        }), media_type="application/json")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error searching for player {player_name} on team {team}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to search for player: {str(e)}")
+        logger.error("Error searching for player %s on team %s: %s", player_name, team, e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to search for player: {str(e)}",
+            headers=_NO_STORE_HEADERS
+        )
+
+# SSE fan-out: one producer task per (team, interval) scrapes and publishes
+# each update to every subscribed client queue
+SSE_SUBSCRIBER_QUEUE_SIZE = 4
+_SSE_UPDATE_PREFIX = b"event: injury_update\ndata: "
+_SSE_ERROR_PREFIX = b"event: error\ndata: "
+_SSE_FRAME_END = b"\n\n"
+_producers: Dict[tuple[str, int], asyncio.Task] = {}
+_subscribers: Dict[tuple[str, int], set[asyncio.Queue]] = {}
+# Most recent frame per producer, replayed to clients that join between ticks
+_last_frame: Dict[tuple[str, int], bytes] = {}
+
+class SseBuffer:
+    """Accumulates pre-encoded SSE frames so pending events go out in one write."""
+    
+    def __init__(self):
+        self._frames: List[bytes] = []
+    
+    def append(self, frame: bytes):
+        """Queue an encoded frame for the next flush."""
+        self._frames.append(frame)
+    
+    def read(self) -> bytes:
+        """Return all queued frames as a single buffer and reset."""
+        data = b"".join(self._frames)
+        self._frames.clear()
+        return data
+
+async def _produce_injury_updates(team: str, interval: int):
+    """Scrape a team on an interval and fan the update out to all subscribers."""
+    key = (team, interval)
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    while _subscribers.get(key):
+        try:
+            team_info = app.state.team_info.get(team)
+            injured_players = await get_cached_injuries(team)
+            
+            update_data = {
+                "team": team,
+                "team_name": team_info.get('name', team) if team_info else team,
+                "total_injured": len(injured_players),
+                "players": injured_players,
+                "timestamp": loop.time()
+            }
+            
+            # Encode the whole SSE frame once; every subscriber gets the same bytes
+            event = _SSE_UPDATE_PREFIX + orjson.dumps(update_data) + _SSE_FRAME_END
+            
+        except Exception as e:
+            logger.error("Error in SSE stream for %s: %s", team, e)
+            event = _SSE_ERROR_PREFIX + orjson.dumps({"error": str(e)}) + _SSE_FRAME_END
+        
+        _last_frame[key] = event
+        for queue in list(_subscribers.get(key, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow client; drop this update rather than stall everyone else
+                logger.warning("Dropping SSE update for slow %s subscriber", team)
+        
+        # Sleep until the next scheduled tick so scrape time doesn't stretch the
+        # period; if a scrape overran the interval, start counting from now
+        next_tick = max(next_tick + interval, loop.time())
+        await asyncio.sleep(next_tick - loop.time())
+    
+    _producers.pop(key, None)
+    _subscribers.pop(key, None)
+    _last_frame.pop(key, None)
 
 # SSE endpoint for real-time updates
 @app.get("/api/teams/{team}/injuries/stream")
-async def stream_team_injuries(team: str, interval: int = Query(30, ge=10, le=300)):
+async def stream_team_injuries(request: Request, team: str,
+                               interval: int = Query(30, ge=10, le=300)):
     """Stream real-time injury updates for a team via Server-Sent Events."""
     
     async def generate_injury_updates():
-        """Generate injury updates at specified intervals."""
-        while True:
-            try:
-                # Validate team exists
-                available_teams = scraper.get_available_teams()
-                if team.lower() not in available_teams:
-                    yield {
-                        "event": "error",
-                        "data": json.dumps({
-                            "error": f"Team '{team}' not supported. Available teams: {', '.join(available_teams)}"
-                        })
-                    }
-                    break
-                
-                team_info = scraper.get_team_info(team.lower())
-                injured_players = scraper.scrape_team_injuries(team.lower())
-                
-                players_data = [
-                    {
-                        "name": player.name,
-                        "position": player.position,
-                        "injury": player.injury,
-                        "il_date": player.il_date,
-                        "expected_return": player.expected_return,
-                        "status": player.status,
-                        "last_updated": player.last_updated
-                    }
-                    for player in injured_players
-                ]
-                
-                update_data = {
-                    "team": team.lower(),
-                    "team_name": team_info.get('name', team) if team_info else team,
-                    "total_injured": len(players_data),
-                    "players": players_data,
-                    "timestamp": asyncio.get_event_loop().time()
-                }
-                
-                yield {
-                    "event": "injury_update",
-                    "data": json.dumps(update_data)
-                }
-                
-                await asyncio.sleep(interval)
-                
-            except Exception as e:
-                logger.error(f"Error in SSE stream for {team}: {e}")
-                yield {
-                    "event": "error",
-                    "data": json.dumps({"error": str(e)})
-                }
-                await asyncio.sleep(interval)
+        """Relay injury updates from the shared team producer to this client."""
+        # Validate team exists
+        if team.lower() not in app.state.available_teams:
+            yield {
+                "event": "error",
+                "data": orjson.dumps({
+                    "error": f"Team '{team}' not supported. Available teams: {app.state.available_teams_csv}"
+                }).decode()
+            }
+            return
+        
+        key = (team.lower(), interval)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_SUBSCRIBER_QUEUE_SIZE)
+        # A client joining a running producer gets its latest update right away
+        # instead of waiting up to a full interval for the next tick
+        last_frame = _last_frame.get(key)
+        if last_frame is not None:
+            queue.put_nowait(last_frame)
+        _subscribers.setdefault(key, set()).add(queue)
+        if key not in _producers:
+            _producers[key] = asyncio.create_task(_produce_injury_updates(*key))
+        
+        buffer = SseBuffer()
+        try:
+            while True:
+                frame = await queue.get()
+                # Release the subscriber slot as soon as the client has gone
+                if await request.is_disconnected():
+                    return
+                buffer.append(frame)
+                # Flush any updates that piled up meanwhile in the same write
+                while not queue.empty():
+                    buffer.append(queue.get_nowait())
+                yield buffer.read()
+        finally:
+            subscribers = _subscribers.get(key)
+            if subscribers is not None:
+                subscribers.discard(queue)
     
-    return EventSourceResponse(generate_injury_updates())
+    # Ask proxies not to buffer so each event is delivered as soon as it is sent
+    return EventSourceResponse(
+        generate_injury_updates(),
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # Legacy endpoints for backward compatibility
 @app.get("/api/mets/injuries")
-async def get_mets_injuries():
+async def get_mets_injuries(request: Request):
     """Legacy endpoint for Mets injuries (redirects to new API)."""
-    return await get_team_injuries("mets")
+    return await get_team_injuries("mets", request)
 
 # Root endpoint with API documentation
 @app.get("/")
@@ -317,15 +490,39 @@ async def root():
         "example_teams": ["mets", "dodgers", "yankees", "astros", "braves"]
     }
 
-def run_http_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
-    """Run the HTTP server."""
-    logger.info(f"Starting MLB Injury Scraper HTTP server on {host}:{port}")
+def run_http_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False,
+                    workers: Optional[int] = None, verbose: Optional[bool] = None):
+    """Run the HTTP server.
+    
+    Uses uvloop and httptools when they are installed (uvicorn[standard]).
+    Runs a single worker unless workers (or MLB_INJURY_WORKERS) asks for more;
+    reload mode always runs one. Each worker has its own scraper, injury and
+    response caches and SSE producers, so N workers scrape MLB.com up to N times
+    per TTL. Workers inherit one environment, so they all share the sqlite HTTP
+    cache at MLB_INJURY_CACHE_PATH (or the default user cache file).
+    Logs at WARNING unless verbose is set (defaults to a --verbose CLI flag).
+    """
+    if verbose is None:
+        verbose = "--verbose" in sys.argv
+    if verbose:
+        os.environ[VERBOSE_ENV_VAR] = "1"
+        logging.getLogger().setLevel(logging.INFO)
+    
+    if reload:
+        workers = 1
+    elif workers is None:
+        workers = int(os.environ.get(WORKERS_ENV_VAR, "1"))
+    
+    logger.info("Starting MLB Injury Scraper HTTP server on %s:%s with %d worker(s)", host, port, workers)
     uvicorn.run(
         "http_server:app",
         host=host,
         port=port,
         reload=reload,
-        log_level="info"
+        workers=workers,
+        loop="auto",
+        http="auto",
+        log_level="info" if verbose else "warning"
     )
 
 if __name__ == "__main__":
@@ -1,12 +1,20 @@
 """MLB injury data scraper."""
 
+import asyncio
+import time
+import httpx
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, Tag
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 import re
 import logging
+import os
 import sys
+import threading
 from pathlib import Path
 
 # Handle TOML imports for different Python versions
@@ -15,9 +23,135 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib
 
+# Prefer selectolax's Lexbor parser (optional 'fast' extra); fall back to BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Position codes that open a player entry ("RHP Name..."); the longest is 3 chars
+_POSITIONS = frozenset({'C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'OF', 'IF', 'P', 'RHP', 'LHP', 'DH', 'INF'})
+
+# Seconds fetched pages and parsed results are reused before re-scraping
+DEFAULT_CACHE_TTL = 600
+HTTP_CACHE_NAME = 'mlb_cache'
+# Overrides the HTTP cache's sqlite file location
+HTTP_CACHE_PATH_ENV_VAR = 'MLB_INJURY_CACHE_PATH'
+# Divs examined by the no-article-found fallback scan
+FALLBACK_DIV_LIMIT = 200
+# Maximum simultaneous page fetches for scrape_teams_async
+ASYNC_MAX_CONCURRENCY = 10
+# Keep-alive connections per host kept by the shared session
+HTTP_POOL_MAXSIZE = 20
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Connection': 'keep-alive'
+}
+
+# Article container selectors in priority order as (css, tag, class token, class substring);
+# the tag/class parts let one combined query be ranked without rescanning the tree
+_ARTICLE_SELECTORS = (
+    ('div.article-content', 'div', 'article-content', None),
+    ('article', 'article', None, None),
+    ('div.article-wrap', 'div', 'article-wrap', None),
+    ('div.article-body', 'div', 'article-body', None),
+    ('div.content', 'div', 'content', None),
+    ('main', 'main', None, None),
+    ('div[class*="article"]', 'div', None, 'article'),
+    ('div[class*="content"]', 'div', None, 'content'),
+)
+_ARTICLE_SELECTOR_LIST = ', '.join(selector for selector, *_ in _ARTICLE_SELECTORS)
+
+# Precompiled patterns for parsing player divs
+_SKIP_HEADER_RE = re.compile(
+    r'this page will be updated|latest injuries|get the latest from mlb|'
+    r'sign up to receive|more mets injury news',
+    re.IGNORECASE
+)
+# Format: "POSITION PlayerNameInjury: ..."; names may contain characters like ñ, ú, etc.
+_MLB_FORMAT_RE = re.compile(
+    r'^([A-Z]{1,3})\s+([A-Z][a-zA-ZñúéíóáüÑÚÉÍÓÁÜ]+(?:\s+[A-Z][a-zA-ZñúéíóáüÑÚÉÍÓÁÜ\'\.]+)+)'
+    r'Injury:\s*(.+?)(?:IL date:|Expected return:|Status:|$)',
+    re.DOTALL
+)
+_IL_DATE_RE = re.compile(r'IL date:\s*([^E]+?)(?:Expected return:|Status:|$)', re.DOTALL)
+_RETURN_RE = re.compile(r'Expected return:\s*([^S]+?)(?:Status:|$)', re.DOTALL)
+_STATUS_RE = re.compile(r'Status:\s*(.+)', re.DOTALL)
+_INJURY_KEYWORD_RE = re.compile(r'injur|\bil\b', re.IGNORECASE)
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_UPDATED_RE = re.compile(r'\(updated\s+(\w+\.?\s+\d+)\)', re.IGNORECASE)
+# Strips "(updated MONTH DAY)" and "More >>" from status text in one pass
+_STATUS_CLEAN_RE = re.compile(r'\s*\(updated\s+\w+\.?\s+\d+\)\s*|\s*More\s*>>\s*', re.IGNORECASE)
+
+def _starts_with_position(text: str) -> bool:
+    """Check whether text opens with a position code followed by whitespace."""
+    parts = text[:4].split(None, 1)
+    token = parts[0] if parts else ''
+    return token in _POSITIONS and len(text) > len(token) and text[len(token)].isspace()
+
+def _charset_from_headers(headers) -> Optional[str]:
+    """Return the charset declared in a Content-Type header, if any."""
+    match = _CHARSET_RE.search(headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+def _parse_document(content: bytes, encoding: Optional[str] = None):
+    """Parse HTML with Lexbor if available, else BeautifulSoup on lxml (or html.parser).
+    
+    Lexbor decodes the raw bytes itself; for BeautifulSoup a known encoding
+    skips its charset sniffing.
+    """
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(content)
+    try:
+        return BeautifulSoup(content, 'lxml', from_encoding=encoding)
+    except FeatureNotFound:
+        return BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+
+def _select_first(node, selector: str):
+    """Return the first node matching a CSS selector, or None."""
+    if isinstance(node, Tag):
+        return node.select_one(selector)
+    return node.css_first(selector)
+
+def _select_all(node, selector: str, limit: Optional[int] = None) -> List:
+    """Return nodes matching a CSS selector, at most limit of them if given."""
+    if isinstance(node, Tag):
+        return node.select(selector, limit=limit or None)
+    matches = node.css(selector)
+    return matches if limit is None else matches[:limit]
+
+def _node_text(node) -> str:
+    """Return the concatenated text of a node and its descendants."""
+    if isinstance(node, Tag):
+        return node.get_text()
+    return node.text()
+
+def _node_classes(node) -> str:
+    """Return a node's class attribute as a string."""
+    if isinstance(node, Tag):
+        return ' '.join(node.get('class', []))
+    return node.attributes.get('class') or ''
+
+def _node_tag(node) -> str:
+    """Return a node's lower-cased tag name."""
+    if isinstance(node, Tag):
+        return node.name
+    return node.tag
+
+def _matches_article_selector(node, tag: str, class_token: Optional[str], class_substring: Optional[str]) -> bool:
+    """Check a node against one _ARTICLE_SELECTORS entry."""
+    if _node_tag(node) != tag:
+        return False
+    classes = _node_classes(node)
+    if class_token is not None:
+        return class_token in classes.split()
+    if class_substring is not None:
+        return class_substring in classes
+    return True
+
+@dataclass(slots=True)
 class InjuredPlayer:
     """Represents an injured MLB player."""
     name: str
@@ -31,11 +165,25 @@ class InjuredPlayer:
 class MLBInjuryScraper:
     """Scraper for MLB injury data."""
     
-    def __init__(self, config_path: Optional[str] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    def __init__(self, config_path: Optional[str] = None, cache_ttl: int = DEFAULT_CACHE_TTL,
+                 cache_path: Optional[str] = None):
+        # HTTP-level cache: repeat fetches within the TTL (or as allowed by the
+        # page's Cache-Control/ETag headers) are answered from a local sqlite file.
+        # A cache_ttl of 0 disables time-based reuse for callers that keep their own
+        # TTL cache: every scrape revalidates, and only unchanged pages skip parsing
+        self.cache_ttl = cache_ttl
+        # sqlite file for the HTTP cache; defaults to the user cache directory so the
+        # CWD doesn't need to be writable. The session is opened on first fetch
+        self.cache_path = cache_path or os.environ.get(HTTP_CACHE_PATH_ENV_VAR)
+        self._session: Optional[requests_cache.CachedSession] = None
+        self._session_lock = threading.Lock()
+        # Per-URL (cache window, parsed result) so repeat lookups in a window skip
+        # parsing too, and one team's entry can be dropped without touching the rest
+        self._parsed: Dict[str, tuple[int, List[InjuredPlayer]]] = {}
+        # Per-URL (ETag, Last-Modified) of the last parsed page and its result,
+        # used for conditional GETs so unchanged pages are neither sent nor parsed
+        self._validators: Dict[str, tuple[Optional[str], Optional[str]]] = {}
+        self._last_result: Dict[str, List[InjuredPlayer]] = {}
         
         # Load team configuration
         if config_path is None:
@@ -45,18 +193,59 @@ class MLBInjuryScraper:
             
         self.teams_config = self._load_config(config_path)
     
+    @property
+    def session(self) -> requests_cache.CachedSession:
+        """The shared cached HTTP session, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self) -> requests_cache.CachedSession:
+        """Open the sqlite-backed session with a retrying keep-alive pool."""
+        # With cache_ttl <= 0 the caller's TTL cache decides freshness, so the page's
+        # own max-age must not let a stored copy be served without revalidating
+        honor_cache_control = self.cache_ttl > 0
+        if self.cache_path:
+            session = requests_cache.CachedSession(
+                self.cache_path,
+                backend='sqlite',
+                expire_after=self.cache_ttl,
+                cache_control=honor_cache_control
+            )
+        else:
+            session = requests_cache.CachedSession(
+                HTTP_CACHE_NAME,
+                backend='sqlite',
+                use_cache_dir=True,
+                expire_after=self.cache_ttl,
+                cache_control=honor_cache_control
+            )
+        
+        # Keep-alive pool sized for concurrent scrapes, retrying transient errors
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(_REQUEST_HEADERS)
+        return session
+    
     def _load_config(self, config_path: Path) -> Dict:
         """Load team configuration from TOML file."""
         try:
             with open(config_path, 'rb') as f:
                 config = tomllib.load(f)
-            logger.info(f"Loaded configuration for {len(config.get('teams', {}))} teams")
+            logger.info("Loaded configuration for %d teams", len(config.get('teams', {})))
             return config
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {config_path}")
+            logger.error("Configuration file not found: %s", config_path)
             return {'teams': {}}
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             return {'teams': {}}
     
     def get_available_teams(self) -> List[str]:
@@ -67,93 +256,205 @@ class MLBInjuryScraper:
         """Get team information by key."""
         return self.teams_config.get('teams', {}).get(team_key.lower())
     
-    def scrape_team_injuries(self, team_key: str) -> List[InjuredPlayer]:
-        """Scrape injury data for a specific team."""
+    def fetch_team_injuries(self, team_key: str) -> List[InjuredPlayer]:
+        """Scrape injury data for a specific team, raising on failure.
+        
+        Raises ValueError for unknown or unconfigured teams and lets fetch and
+        parse errors propagate, so callers can tell a failed scrape from a
+        team with no injuries.
+        """
         team_info = self.get_team_info(team_key)
         if not team_info:
-            logger.error(f"Team '{team_key}' not found in configuration")
-            return []
+            raise ValueError(f"Team '{team_key}' not found in configuration")
         
         url = team_info.get('url')
         if not url:
-            logger.error(f"No URL configured for team '{team_key}'")
-            return []
+            raise ValueError(f"No URL configured for team '{team_key}'")
         
-        logger.info(f"Scraping injuries for {team_info.get('name', team_key)} from {url}")
+        logger.info("Scraping injuries for %s from %s", team_info.get('name', team_key), url)
         
+        # Copy so callers can't mutate the cached list
+        if self.cache_ttl <= 0:
+            return list(self._scrape_url(url))
+        bucket = self._cache_bucket()
+        parsed = self._parsed.get(url)
+        if parsed is None or parsed[0] != bucket:
+            parsed = (bucket, self._scrape_url(url))
+            self._parsed[url] = parsed
+        return list(parsed[1])
+    
+    def scrape_team_injuries(self, team_key: str) -> List[InjuredPlayer]:
+        """Scrape injury data for a specific team, returning [] on any error."""
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            injured_players = []
-            
-            # Debug: Print page title to confirm we got the right page
-            title = soup.find('title')
-            if title:
-                logger.info(f"Page title: {title.get_text()}")
-            
-            # Try multiple selectors for article content
-            article_selectors = [
-                'div.article-content',
-                'article',
-                'div.article-wrap',
-                'div.article-body',
-                'div.content',
-                'main',
-                'div[class*="article"]',
-                'div[class*="content"]'
-            ]
-            
-            article_content = None
-            for selector in article_selectors:
-                article_content = soup.select_one(selector)
-                if article_content:
-                    logger.info(f"Found content using selector: {selector}")
-                    break
-            
-            if not article_content:
-                # Fallback: look for any div with substantial text content
-                all_divs = soup.find_all('div')
-                for div in all_divs:
-                    text = div.get_text().strip()
-                    if len(text) > 500 and any(keyword in text.lower() for keyword in ['injury', 'injured', 'il']):
-                        article_content = div
-                        logger.info("Found content using fallback method")
-                        break
-            
-            if not article_content:
-                logger.warning("Could not find article content")
-                # Debug: Print some of the page structure
-                logger.info("Available div classes:")
-                for div in soup.find_all('div', class_=True)[:10]:
-                    logger.info(f"  {div.get('class')}")
-                return []
-            
-            # Extract injury information maintaining order
-            injury_data = self._extract_structured_injury_info(article_content)
-            
-            for data in injury_data:
-                player = InjuredPlayer(
-                    name=data.get('name', 'Unknown'),
-                    position=data.get('position', 'Unknown'),
-                    injury=data.get('injury', 'Unknown'),
-                    il_date=data.get('il_date'),
-                    expected_return=data.get('expected_return'),
-                    status=data.get('status'),
-                    last_updated=data.get('last_updated')
-                )
-                injured_players.append(player)
-            
-            return injured_players
+            return self.fetch_team_injuries(team_key)
             
+        except ValueError as e:
+            logger.error("%s", e)
+            return []
         except requests.RequestException as e:
-            logger.error(f"Error fetching injury data for {team_key}: {e}")
+            logger.error("Error fetching injury data for %s: %s", team_key, e)
             return []
         except Exception as e:
-            logger.error(f"Error parsing injury data for {team_key}: {e}")
+            logger.error("Error parsing injury data for %s: %s", team_key, e)
             return []
     
+    def clear_cache(self, team_key: Optional[str] = None):
+        """Drop cached pages and parsed results so the next scrape refetches.
+        
+        Clears only the given team's page and parsed result when team_key is set,
+        otherwise every team's.
+        """
+        if team_key is None:
+            self._parsed.clear()
+            self._validators.clear()
+            self._last_result.clear()
+            if self._session is not None:
+                self._session.cache.clear()
+            return
+        team_info = self.get_team_info(team_key)
+        if team_info and team_info.get('url'):
+            self._parsed.pop(team_info['url'], None)
+            self._validators.pop(team_info['url'], None)
+            self._last_result.pop(team_info['url'], None)
+            if self._session is not None:
+                self._session.cache.delete(urls=[team_info['url']])
+    
+    def _cache_bucket(self) -> int:
+        """Current cache window index; parsed results are reused within a window."""
+        return int(time.time() // self.cache_ttl)
+    
+    def _scrape_url(self, url: str) -> List[InjuredPlayer]:
+        """Fetch and parse an injury page.
+        
+        Errors propagate so that failed scrapes are never cached.
+        """
+        headers = {}
+        validators = self._validators.get(url)
+        if validators and url in self._last_result:
+            etag, last_modified = validators
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = self.session.get(url, timeout=10, headers=headers)
+        if response.status_code == 304 and url in self._last_result:
+            logger.info("Page not modified, reusing parsed result: %s", url)
+            return self._last_result[url]
+        response.raise_for_status()
+        
+        # The HTTP cache may answer a revalidation with the stored page; if its
+        # validators match what we last parsed, skip parsing it again
+        new_validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        if any(new_validators) and new_validators == validators and url in self._last_result:
+            return self._last_result[url]
+        
+        injured_players = self._parse_html(response.content, _charset_from_headers(response.headers))
+        self._validators[url] = new_validators
+        self._last_result[url] = injured_players
+        return injured_players
+    
+    def _parse_html(self, content: bytes, encoding: Optional[str] = None) -> List[InjuredPlayer]:
+        """Parse injured players out of an MLB.com injury page."""
+        tree = _parse_document(content, encoding)
+        injured_players = []
+        
+        # Debug: Print page title to confirm we got the right page
+        title = _select_first(tree, 'title')
+        if title and logger.isEnabledFor(logging.INFO):
+            logger.info("Page title: %s", _node_text(title))
+        
+        # Collect every candidate container in one pass, then pick the first node matching
+        # the highest-priority selector (same result as trying each selector in turn)
+        candidates = _select_all(tree, _ARTICLE_SELECTOR_LIST)
+        article_content = None
+        for selector, tag, class_token, class_substring in _ARTICLE_SELECTORS:
+            article_content = next(
+                (node for node in candidates
+                 if _matches_article_selector(node, tag, class_token, class_substring)),
+                None
+            )
+            if article_content:
+                logger.debug("Found content using selector: %s", selector)
+                break
+        
+        if not article_content:
+            # Fallback: look for any div with substantial text content. Each text
+            # extraction walks a subtree, so only the first few hundred divs are tried
+            for div in _select_all(tree, 'div', limit=FALLBACK_DIV_LIMIT):
+                text = _node_text(div).strip()
+                if len(text) > 500 and _INJURY_KEYWORD_RE.search(text):
+                    article_content = div
+                    logger.debug("Found content using fallback method")
+                    break
+        
+        if not article_content:
+            logger.warning("Could not find article content")
+            # Debug: Print some of the page structure
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available div classes:")
+                for div in _select_all(tree, 'div[class]')[:10]:
+                    logger.debug("  %s", _node_classes(div))
+            return []
+        
+        # Extract injury information maintaining order
+        injury_data = self._extract_structured_injury_info(article_content)
+        
+        for data in injury_data:
+            # Position, injury and status come from small vocabularies, so
+            # intern them to share one string object per distinct value
+            status = data.get('status')
+            player = InjuredPlayer(
+                name=data.get('name', 'Unknown'),
+                position=sys.intern(data.get('position') or 'Unknown'),
+                injury=sys.intern(data.get('injury') or 'Unknown'),
+                il_date=data.get('il_date'),
+                expected_return=data.get('expected_return'),
+                status=sys.intern(status) if status else status,
+                last_updated=data.get('last_updated')
+            )
+            injured_players.append(player)
+        
+        return injured_players
+    
+    async def scrape_teams_async(self, team_keys: List[str]) -> Dict[str, List[InjuredPlayer]]:
+        """Scrape several teams concurrently, returning players keyed by team.
+        
+        Pages are fetched over one pooled httpx.AsyncClient (at most
+        ASYNC_MAX_CONCURRENCY at a time) and parsed on worker threads so the
+        event loop isn't stalled. Teams that fail map to an empty list.
+        """
+        semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        
+        async with httpx.AsyncClient(headers=_REQUEST_HEADERS, timeout=10,
+                                     follow_redirects=True) as client:
+            async def scrape_one(team_key: str):
+                team_info = self.get_team_info(team_key)
+                if not team_info or not team_info.get('url'):
+                    logger.error("Team '%s' not found in configuration", team_key)
+                    return team_key, []
+                
+                try:
+                    async with semaphore:
+                        response = await client.get(team_info['url'])
+                        response.raise_for_status()
+                    players = await loop.run_in_executor(
+                        None, self._parse_html, response.content,
+                        _charset_from_headers(response.headers)
+                    )
+                    return team_key, players
+                except httpx.HTTPError as e:
+                    logger.error("Error fetching injury data for %s: %s", team_key, e)
+                    return team_key, []
+                except Exception as e:
+                    logger.error("Error parsing injury data for %s: %s", team_key, e)
+                    return team_key, []
+            
+            results = await asyncio.gather(*(scrape_one(team_key) for team_key in team_keys))
+        
+        return dict(results)
+    
     def scrape_mets_injuries(self) -> List[InjuredPlayer]:
         """Scrape Mets injury data from MLB.com (legacy method for backward compatibility)."""
         return self.scrape_team_injuries('mets')
@@ -163,65 +464,58 @@ class MLBInjuryScraper:
         injury_data = []
         
         # Look for the section element within the article
-        section = content.find('section')
+        section = _select_first(content, 'section')
         if not section:
             logger.warning("Could not find section element")
             # Try looking in the entire article content
             section = content
         
-        # Debug: Show what divs are available
-        all_divs = section.find_all('div')
-        logger.info(f"Found {len(all_divs)} total divs in section")
-        
-        # Show first few divs with their classes
-        for i, div in enumerate(all_divs[:10]):
-            div_class = div.get('class', [])
-            div_text = div.get_text().strip()[:100]
-            logger.info(f"Div {i}: class={div_class}")
-            logger.info(f"  Text: {div_text}...")
+        # Debug: Show what divs are available (walks the whole section, so only
+        # when debug logging is actually on)
+        if logger.isEnabledFor(logging.DEBUG):
+            all_divs = _select_all(section, 'div')
+            logger.debug("Found %d total divs in section", len(all_divs))
+            
+            # Show first few divs with their classes
+            for i, div in enumerate(all_divs[:10]):
+                logger.debug("Div %d: class=%s", i, _node_classes(div))
+                logger.debug("  Text: %s...", _node_text(div).strip()[:100])
         
         # Find divs that have both "story-part" AND "markdown" in their class
-        markdown_divs = section.find_all('div', class_=lambda x: x and 'story-part' in x and 'markdown' in x)
-        logger.info(f"Found {len(markdown_divs)} divs with both story-part and markdown classes")
+        markdown_divs = _select_all(section, 'div.story-part.markdown')
+        logger.debug("Found %d divs with both story-part and markdown classes", len(markdown_divs))
         
         for i, div in enumerate(markdown_divs):
-            div_text = div.get_text().strip()
+            div_text = _node_text(div).strip()
             
             # Skip empty divs
             if not div_text:
                 continue
             
-            logger.info(f"Processing div {i}: {div_text[:100]}...")
+            logger.debug("Processing div %d: %.100s...", i, div_text)
             
             # Skip header/intro divs that don't contain player data
-            if any(skip_phrase in div_text.lower() for skip_phrase in [
-                'this page will be updated',
-                'latest injuries',
-                'get the latest from mlb',
-                'sign up to receive',
-                'more mets injury news'
-            ]):
-                logger.info(f"Skipping header/intro div: {div_text[:50]}...")
+            if _SKIP_HEADER_RE.search(div_text):
+                logger.debug("Skipping header/intro div: %.50s...", div_text)
                 continue
             
             # Check if this div starts with a position (indicating a player)
-            position_pattern = r'^(C|1B|2B|3B|SS|LF|CF|RF|OF|IF|P|RHP|LHP|DH|INF)\s+'
-            if not re.match(position_pattern, div_text):
-                logger.info(f"Skipping div - doesn't start with position: {div_text[:50]}...")
+            if not _starts_with_position(div_text):
+                logger.debug("Skipping div - doesn't start with position: %.50s...", div_text)
                 continue
             
             # Parse the player information from this div
             parsed_info = self._parse_player_div(div)
             if parsed_info:
-                logger.info(f"Found player: {parsed_info['name']}")
+                logger.debug("Found player: %s", parsed_info['name'])
                 injury_data.append(parsed_info)
         
-        logger.info(f"Total players found: {len(injury_data)}")
+        logger.info("Total players found: %d", len(injury_data))
         return injury_data
     
     def _parse_player_div(self, div) -> Optional[Dict]:
         """Parse player information from a markdown div element."""
-        div_text = div.get_text().strip()
+        div_text = _node_text(div).strip()
         
         # Extract information from the div text
         player_info = {
@@ -235,8 +529,7 @@ class MLBInjuryScraper:
         }
         
         # The MLB page has format: "POSITION PlayerNameInjury: ..."
-        # Handle names with special characters like ñ, ú, etc.
-        mlb_format_match = re.search(r'^([A-Z]{1,3})\s+([A-Z][a-zA-ZñúéíóáüÑÚÉÍÓÁÜ]+(?:\s+[A-Z][a-zA-ZñúéíóáüÑÚÉÍÓÁÜ\'\.]+)+)Injury:\s*(.+?)(?:IL date:|Expected return:|Status:|$)', div_text, re.DOTALL)
+        mlb_format_match = _MLB_FORMAT_RE.search(div_text)
         
         if mlb_format_match:
             player_info['position'] = mlb_format_match.group(1)
@@ -247,199 +540,29 @@ class MLBInjuryScraper:
             player_info['injury'] = injury_section
             
             # Extract IL date
-            il_match = re.search(r'IL date:\s*([^E]+?)(?:Expected return:|Status:|$)', div_text, re.DOTALL)
+            il_match = _IL_DATE_RE.search(div_text)
             if il_match:
                 player_info['il_date'] = il_match.group(1).strip()
             
             # Extract expected return
-            return_match = re.search(r'Expected return:\s*([^S]+?)(?:Status:|$)', div_text, re.DOTALL)
+            return_match = _RETURN_RE.search(div_text)
             if return_match:
                 player_info['expected_return'] = return_match.group(1).strip()
             
             # Extract last updated info first - look for specific "(updated MONTH DAY)" pattern
             # This pattern appears at the end of the text, either at the very end or before "More >>"
-            updated_patterns = [
-                r'\(updated\s+(\w+\.?\s+\d+)\)',
-                r'\(Updated\s+(\w+\.?\s+\d+)\)'
-            ]
-            
-            for pattern in updated_patterns:
-                updated_match = re.search(pattern, div_text)
-                if updated_match:
-                    player_info['last_updated'] = updated_match.group(1)
-                    break
-            
-
+            updated_match = _UPDATED_RE.search(div_text)
+            if updated_match:
+                player_info['last_updated'] = updated_match.group(1)
             
             # Extract status information - get everything after "Status:" but remove the "(updated...)" part
-            status_match = re.search(r'Status:\s*(.+)', div_text, re.DOTALL)
+            status_match = _STATUS_RE.search(div_text)
             if status_match:
-                status_text = status_match.group(1).strip()
-                # Remove the "(updated MONTH DAY)" part from status - try multiple patterns
-                status_text = re.sub(r'\s*\(updated\s+\w+\.?\s+\d+\)\s*', '', status_text, flags=re.IGNORECASE)
-                status_text = re.sub(r'\s*\(Updated\s+\w+\.?\s+\d+\)\s*', '', status_text)
-                # Clean up the status text - remove "More >>" if present
-                status_text = re.sub(r'\s*More\s*>>\s*', '', status_text)
-                status_text = status_text.strip()
+                # Remove the "(updated MONTH DAY)" part and any "More >>" link text
+                status_text = _STATUS_CLEAN_RE.sub('', status_match.group(1)).strip()
                 if status_text:
                     player_info['status'] = status_text
             
             return player_info
         
         return None
-    
-    def _parse_structured_injury_paragraph(self, paragraph, bold_elements) -> Optional[Dict]:
-        """Parse injury information from a structured paragraph with bold elements."""
-        paragraph_text = paragraph.get_text().strip()
-        
-        # Extract information from bold text and surrounding context
-        player_info = {
-            'name': None,
-            'position': None,
-            'injury': None,
-            'il_date': None,
-            'expected_return': None,
-            'last_updated': None
-        }
-        
-        # The MLB page has a specific format: "POSITION PlayerNameInjury: ..."
-        # Let's parse this format specifically
-        mlb_format_match = re.search(r'^([A-Z]{1,3})\s+([A-Z][a-z]+(?:\s+[A-Z][a-z\']+)+)Injury:\s*(.+?)(?:IL date:|Expected return:|Status:|$)', paragraph_text, re.DOTALL)
-        
-        if mlb_format_match:
-            player_info['position'] = mlb_format_match.group(1)
-            player_info['name'] = mlb_format_match.group(2).strip()
-            injury_section = mlb_format_match.group(3).strip()
-            
-            # Clean up injury text
-            player_info['injury'] = injury_section
-            
-            # Extract IL date
-            il_match = re.search(r'IL date:\s*([^E]+?)(?:Expected return:|Status:|$)', paragraph_text, re.DOTALL)
-            if il_match:
-                player_info['il_date'] = il_match.group(1).strip()
-            
-            # Extract expected return
-            return_match = re.search(r'Expected return:\s*([^S]+?)(?:Status:|$)', paragraph_text, re.DOTALL)
-            if return_match:
-                player_info['expected_return'] = return_match.group(1).strip()
-            
-            # Extract status/last updated info
-            status_match = re.search(r'Status:\s*(.+)', paragraph_text, re.DOTALL)
-            if status_match:
-                status_text = status_match.group(1).strip()
-                # Look for dates in the status that might indicate last updated
-                date_in_status = re.search(r'(\w+\s+\d+)', status_text)
-                if date_in_status:
-                    player_info['last_updated'] = date_in_status.group(1)
-            
-            return player_info
-        
-        # Fallback: try other patterns if the main one doesn't work
-        # Look for player name pattern in bold text first
-        for bold in bold_elements:
-            bold_text = bold.get_text().strip()
-            
-            # Skip common non-player bold text
-            if any(skip_word in bold_text.lower() for skip_word in 
-                   ['player name:', 'injury:', 'il date:', 'expected return:', 'status:', 'updated:']):
-                continue
-            
-            # Look for actual player names (First Last format)
-            name_match = re.search(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z\']+)+)', bold_text)
-            if name_match:
-                potential_name = name_match.group(1)
-                # Validate it's not a common phrase
-                if not any(common in potential_name.lower() for common in 
-                          ['little league', 'new york', 'major league', 'world series']):
-                    player_info['name'] = potential_name
-                    break
-        
-        if not player_info['name']:
-            return None
-        
-        # Extract position - look for patterns like "Player position: C" or "(C)" after name
-        position_patterns = [
-            r'Player position:\s*([A-Z0-9]+)',
-            r'player position:\s*([A-Z0-9]+)',
-            r'\(([A-Z0-9]+)\)',  # Position in parentheses
-            r'\b(C|1B|2B|3B|SS|LF|CF|RF|OF|IF|P|RHP|LHP|DH)\b'
-        ]
-        
-        for pattern in position_patterns:
-            position_match = re.search(pattern, paragraph_text)
-            if position_match:
-                player_info['position'] = position_match.group(1)
-                break
-        
-        # Extract injury from bold text or context
-        injury_patterns = [
-            r'Injury:\s*([^\n|]+)',
-            r'injury:\s*([^\n|]+)',
-            r'((?:right|left)\s+(?:hand|thumb|elbow|shoulder|knee|ankle|back|hamstring|quad|calf|wrist|finger))',
-            r'((?:strained|sprained|torn|fractured)\s+[^\n|,]+)',
-            r'(hand|thumb|elbow|shoulder|knee|ankle|back|hamstring|quad|calf|wrist|finger)(?:\s+(?:injury|strain|sprain))?'
-        ]
-        
-        for pattern in injury_patterns:
-            injury_match = re.search(pattern, paragraph_text, re.IGNORECASE)
-            if injury_match:
-                if 'injury:' in pattern.lower():
-                    player_info['injury'] = injury_match.group(1).strip()
-                else:
-                    injury_text = injury_match.group(1).strip()
-                    # Clean up the injury text
-                    injury_text = re.sub(r'\s+', ' ', injury_text)  # Remove extra whitespace
-                    player_info['injury'] = injury_text.title()
-                break
-        
-        # Extract IL date
-        il_date_patterns = [
-            r'IL date:\s*([^|]+)',
-            r'il date:\s*([^|]+)',
-            r'placed on.*?IL.*?(\w+\s+\d+)',
-            r'(\w+\s+\d+).*?IL'
-        ]
-        
-        for pattern in il_date_patterns:
-            il_match = re.search(pattern, paragraph_text, re.IGNORECASE)
-            if il_match:
-                player_info['il_date'] = il_match.group(1).strip()
-                break
-        
-        # Extract expected return
-        return_patterns = [
-            r'Expected return:\s*([^|]+)',
-            r'expected return:\s*([^|]+)',
-            r'(day-to-day|day to day)',
-            r'expected.*?(\d+\s*(?:days?|weeks?|months?))',
-            r'return.*?(\d{4}|season)'
-        ]
-        
-        for pattern in return_patterns:
-            return_match = re.search(pattern, paragraph_text, re.IGNORECASE)
-            if return_match:
-                if 'expected return:' in pattern.lower():
-                    player_info['expected_return'] = return_match.group(1).strip()
-                else:
-                    player_info['expected_return'] = return_match.group(0).strip()
-                break
-        
-        # Extract last updated (look for dates)
-        date_patterns = [
-            r'Updated:\s*([^|]+)',
-            r'updated:\s*([^|]+)',
-            r'(\w+\s+\d+,?\s*\d*)'
-        ]
-        
-        for pattern in date_patterns:
-            date_match = re.search(pattern, paragraph_text, re.IGNORECASE)
-            if date_match:
-                player_info['last_updated'] = date_match.group(1).strip()
-                break
-        
-        # Only return if we have at least name and some injury info
-        if player_info['name'] and (player_info['injury'] or player_info['il_date'] or player_info['expected_return']):
-            return player_info
-        
-        return None
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Test script for the MLB injury scraper."""
 
+import asyncio
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,13 +28,14 @@ def main():
     if len(teams) > 5:
         print(f"  ... and {len(teams) - 5} more teams")
     
-    # Test teams to scrape
+    # Test teams to scrape (fetched concurrently, then again through the sync path)
     test_teams = ['mets', 'dodgers', 'yankees']
+    results = asyncio.run(scraper.scrape_teams_async(test_teams))
     
     for team in test_teams:
         print(f"\n=== Testing {team.upper()} ===")
         try:
-            injured_players = scraper.scrape_team_injuries(team)
+            injured_players = results[team]
             
             print(f"Found {len(injured_players)} injured players:")
             print("-" * 50)
@@ -56,6 +58,13 @@ def main():
             if len(injured_players) > 3:
                 print(f"... and {len(injured_players) - 3} more injured players")
             
+            # The servers scrape through the sync requests-cache session (conditional
+            # GETs, retry policy), so check that path agrees with the async one
+            sync_players = scraper.fetch_team_injuries(team)
+            print(f"Sync scrape found {len(sync_players)} injured players")
+            if len(sync_players) != len(injured_players):
+                print("WARNING: sync and async scrapes disagree")
+            
             if not injured_players:
                 print("No injury data found. This could mean:")
                 print("1. No players are currently injured")
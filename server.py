@@ -1,145 +1,420 @@
 """FastMCP server for MLB injury data with optional HTTP mode."""
 
 import asyncio
+import functools
 import logging
+import operator
+import os
 import sys
-from typing import List, Dict, Any
+import threading
+import time
+from collections import Counter
+from contextlib import asynccontextmanager, suppress
+from dataclasses import fields
+from typing import List, Dict, Any, Optional
+import anyio
+import orjson
 from fastmcp import FastMCP
-from scraper import MLBInjuryScraper, InjuredPlayer
+from mcp.types import TextContent
+from scraper import HTTP_POOL_MAXSIZE, MLBInjuryScraper, InjuredPlayer
+
+# rapidfuzz (optional 'fuzzy' extra) enables typo-tolerant player search
+try:
+    from rapidfuzz import process as fuzz_process
+except ImportError:
+    fuzz_process = None
+
+# uvloop (optional 'fast' extra on non-Windows) runs the MCP event loop in C
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Comma-separated team keys kept warm in the cache while the server runs
+HOT_TEAMS_ENV_VAR = "MLB_INJURY_HOT_TEAMS"
+DEFAULT_HOT_TEAMS = "mets,dodgers,yankees"
+# Seconds before TTL expiry that hot teams are re-scraped
+PREWARM_LEAD = 30
+_prewarm_task: Optional[asyncio.Task] = None
+# Lifespans currently entered; some transports enter one per client session
+_lifespan_users = 0
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Run the background refresher for hot teams while the server is up."""
+    global _prewarm_task, _lifespan_users
+    _lifespan_users += 1
+    if _prewarm_task is None or _prewarm_task.done():
+        _prewarm_task = asyncio.create_task(_prewarm_hot_teams())
+    try:
+        yield
+    finally:
+        _lifespan_users -= 1
+        # Stop refreshing once the last user is gone so shutdown leaves no pending task
+        if _lifespan_users == 0 and _prewarm_task is not None:
+            _prewarm_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await _prewarm_task
+            _prewarm_task = None
+
 # Create FastMCP server
-mcp = FastMCP("MLB Injury Scraper")
+mcp = FastMCP("MLB Injury Scraper", lifespan=_lifespan)
 
-# Initialize scraper
-scraper = MLBInjuryScraper()
+# Initialize scraper; its one requests session (and keep-alive pool) is shared by every
+# scrape thread, so connections to MLB.com are reused across tool calls. _CACHE below
+# owns freshness, so the scraper revalidates on every scrape instead of reusing
+# results for its own TTL
+scraper = MLBInjuryScraper(cache_ttl=0)
 
-@mcp.tool()
-def get_team_injuries(team: str) -> List[Dict[str, Any]]:
-    """Get current injury report for any MLB team.
+# Seconds a team's scraped players are reused across tool calls
+_TTL = 300
+# Seconds past the TTL a stale entry is still served while it refreshes in the background
+_STALE_GRACE = 600
+# InjuredPlayer fields in declaration order, read in one attrgetter call per player
+_FIELDS = tuple(field.name for field in fields(InjuredPlayer))
+_get_fields = operator.attrgetter(*_FIELDS)
+# Entries are (scraped_at, players, serialized player dicts, lowercased name -> dict, JSON text)
+_CACHE: Dict[str, tuple[float, List[InjuredPlayer], List[Dict[str, Any]], Dict[str, Dict[str, Any]], str]] = {}
+# Minimum rapidfuzz score (0-100) for a fuzzy player-name match
+FUZZY_SCORE_CUTOFF = 80
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS: Counter = Counter()
+# Scrapes currently running, keyed by team
+_INFLIGHT: Dict[str, asyncio.Task] = {}
+# Maximum teams scraped at once by get_multi_team_injuries
+MULTI_TEAM_CONCURRENCY = 8
+_multi_team_semaphore = asyncio.Semaphore(MULTI_TEAM_CONCURRENCY)
+# Scrape threads running at once, kept within the session's connection pool
+MAX_CONCURRENT_SCRAPES = min(16, HTTP_POOL_MAXSIZE)
+_scrape_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+@functools.lru_cache(maxsize=1)
+def _available_teams() -> tuple[str, ...]:
+    """Team keys from the scraper config, in config order."""
+    return tuple(scraper.get_available_teams())
+
+@functools.lru_cache(maxsize=1)
+def _available_teams_set() -> frozenset:
+    """Team keys from the scraper config, for membership checks."""
+    return frozenset(_available_teams())
+
+@functools.lru_cache(maxsize=64)
+def _team_info(team_key: str) -> Optional[Dict]:
+    """Config entry for a team; the config is static for the process lifetime."""
+    return scraper.get_team_info(team_key)
+
+@functools.lru_cache(maxsize=1)
+def _teams_snapshot() -> Dict[str, Any]:
+    """Build the get_available_teams payload once."""
+    teams = _available_teams()
+    team_info = {}
     
-    Args:
-        team: Team key (e.g., 'mets', 'dodgers', 'yankees')
+    for team_key in teams:
+        info = _team_info(team_key)
+        if info:
+            team_info[team_key] = {
+                "name": info.get('name', team_key),
+                "abbreviation": info.get('abbreviation', team_key.upper())
+            }
+    
+    return {
+        "total_teams": len(teams),
+        "teams": team_info
+    }
+
+def _build_name_index(serialized: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index player dicts by lowercased name, keeping the first player for duplicates."""
+    name_index = {}
+    for player in serialized:
+        name_index.setdefault(player['name'].lower(), player)
+    return name_index
+
+def _usable_entry(team: str, _cache_get=_CACHE.get, _monotonic=time.monotonic, _stats=_CACHE_STATS):
+    """Return a team's cache entry unless it is past the stale grace period.
+    
+    Entries older than the TTL are still returned, after starting a background
+    refresh (stale-while-revalidate). This runs on every tool call, so the cache
+    lookups are bound as defaults to make them local loads.
+    """
+    entry = _cache_get(team)
+    if entry is None:
+        return None
+    
+    age = _monotonic() - entry[0]
+    if age < _TTL:
+        _stats['hit'] += 1
+        logger.debug("Cache hit for %s (hits=%d, misses=%d)", team, _stats['hit'], _stats['miss'])
+        return entry
+    if age < _TTL + _STALE_GRACE:
+        _stats['stale'] += 1
+        logger.debug("Serving stale entry for %s (%.0fs old), refreshing", team, age)
+        _start_scrape(team)
+        return entry
+    return None
+
+def _scrape_entry(team: str):
+    """Scrape a team and store the result as its cache entry (blocking).
+    
+    Failed scrapes raise and leave the cache untouched, so an error is never
+    cached as an empty injury list.
+    """
+    injured_players = scraper.fetch_team_injuries(team)
+    # Serialize once per scrape so cache hits reuse the same dicts; position, injury and
+    # status values are already interned by the scraper, so the dicts share those strings
+    serialized = [dict(zip(_FIELDS, _get_fields(player))) for player in injured_players]
+    entry = (
+        time.monotonic(),
+        injured_players,
+        serialized,
+        _build_name_index(serialized),
+        orjson.dumps(serialized).decode()
+    )
+    # Scrapes run on worker threads via asyncio.to_thread
+    with _CACHE_LOCK:
+        _CACHE[team] = entry
+    return entry
+
+async def _run_scrape(team: str):
+    """Scrape a team on a worker thread once a pool slot is free."""
+    async with _scrape_semaphore:
+        return await asyncio.to_thread(_scrape_entry, team)
+
+def _start_scrape(team: str) -> asyncio.Task:
+    """Return the running scrape task for a team, starting one if none is in flight."""
+    # Concurrent misses for the same team share one scrape
+    task = _INFLIGHT.get(team)
+    if task is None:
+        task = asyncio.create_task(_run_scrape(team))
+        _INFLIGHT[team] = task
+        task.add_done_callback(lambda done: _finish_scrape(team, done))
+    return task
+
+def _finish_scrape(team: str, task: asyncio.Task):
+    """Drop a finished scrape from the in-flight map and log failures.
+    
+    A failed scrape leaves the existing cache entry in place, so a stale entry
+    keeps being served until the stale grace period ends.
     """
+    _INFLIGHT.pop(team, None)
+    if task.cancelled():
+        return
+    # Retrieving the exception also stops asyncio warning about it when only a
+    # background refresh (with no waiting caller) was running
+    error = task.exception()
+    if error is not None:
+        logger.warning("Scrape for %s failed, keeping cached data: %s", team, error)
+
+async def _get_cache_entry(team: str, _usable=_usable_entry):
+    """Get a team's cache entry, scraping at most once per TTL window."""
+    # Cache hits, fresh or stale, are answered without waiting on a scrape
+    entry = _usable(team)
+    if entry is not None:
+        return entry
+    
+    _CACHE_STATS['miss'] += 1
+    logger.debug("Cache miss for %s (hits=%d, misses=%d)", team, _CACHE_STATS['hit'], _CACHE_STATS['miss'])
+    # Shield so one cancelled caller doesn't cancel the scrape for the others
+    return await asyncio.shield(_start_scrape(team))
+
+def _hot_teams() -> List[str]:
+    """Team keys to keep warm, read from the environment and limited to configured teams."""
+    requested = os.environ.get(HOT_TEAMS_ENV_VAR, DEFAULT_HOT_TEAMS)
+    available = _available_teams_set()
+    return [team for team in (t.strip().lower() for t in requested.split(',')) if team in available]
+
+async def _prewarm_hot_teams():
+    """Scrape hot teams at startup, then re-scrape them shortly before their entries expire."""
+    teams = _hot_teams()
+    if not teams:
+        return
+    
+    logger.info("Prewarming cache for %s", ', '.join(teams))
+    while True:
+        await asyncio.gather(*(_start_scrape(team) for team in teams), return_exceptions=True)
+        await asyncio.sleep(max(_TTL - PREWARM_LEAD, 1))
+
+async def _get_players_cached(team: str) -> List[InjuredPlayer]:
+    """Get a team's injured players, scraping at most once per TTL window."""
+    return (await _get_cache_entry(team))[1]
+
+def _unsupported_team_error(team: str) -> Optional[Dict[str, Any]]:
+    """Return an error payload for a team key missing from the config, else None."""
+    if team.lower() in _available_teams_set():
+        return None
+    return {"error": f"Team '{team}' not supported. Available teams: {', '.join(_available_teams())}"}
+
+async def _team_injuries(team: str) -> List[Dict[str, Any]]:
+    """Shared implementation of get_team_injuries and get_mets_injuries."""
+    # Reject unknown teams before any scrape is attempted
+    error = _unsupported_team_error(team)
+    if error:
+        return [error]
+    
     try:
-        injured_players = scraper.scrape_team_injuries(team.lower())
+        serialized = (await _get_cache_entry(team.lower()))[2]
         
-        if not injured_players:
-            # Check if team exists in config
-            available_teams = scraper.get_available_teams()
-            if team.lower() not in available_teams:
-                return [{
-                    "error": f"Team '{team}' not supported. Available teams: {', '.join(available_teams)}"
-                }]
-            else:
-                return [{"message": f"No injury data found for {team}"}]
+        if not serialized:
+            return [{"message": f"No injury data found for {team}"}]
         
-        # Convert to dictionaries for JSON serialization
-        result = []
-        for player in injured_players:
-            result.append({
-                "name": player.name,
-                "position": player.position,
-                "injury": player.injury,
-                "il_date": player.il_date,
-                "expected_return": player.expected_return,
-                "status": player.status,
-                "last_updated": player.last_updated
-            })
+        result = list(serialized)
         
-        logger.info(f"Retrieved {len(result)} injured players for {team}")
+        logger.info("Retrieved %d injured players for %s", len(result), team)
         return result
         
     except Exception as e:
-        logger.error(f"Error getting {team} injuries: {e}")
+        logger.error("Error getting %s injuries: %s", team, e)
         return [{"error": f"Failed to retrieve injury data for {team}: {str(e)}"}]
 
 @mcp.tool()
-def get_mets_injuries() -> List[Dict[str, Any]]:
+async def get_team_injuries(team: str) -> List[Dict[str, Any]]:
+    """Get current injury report for any MLB team.
+    
+    Args:
+        team: Team key (e.g., 'mets', 'dodgers', 'yankees')
+    """
+    return await _team_injuries(team)
+
+@mcp.tool()
+async def get_team_injuries_json(team: str) -> TextContent:
+    """Get current injury report for any MLB team as JSON text, encoded once per scrape.
+    
+    Args:
+        team: Team key (e.g., 'mets', 'dodgers', 'yankees')
+    """
+    error = _unsupported_team_error(team)
+    if error:
+        return TextContent(type="text", text=orjson.dumps([error]).decode())
+    
+    try:
+        entry = await _get_cache_entry(team.lower())
+        
+        if entry[2]:
+            logger.info("Retrieved %d injured players for %s", len(entry[2]), team)
+            return TextContent(type="text", text=entry[4])
+        result = [{"message": f"No injury data found for {team}"}]
+        
+    except Exception as e:
+        logger.error("Error getting %s injuries: %s", team, e)
+        result = [{"error": f"Failed to retrieve injury data for {team}: {str(e)}"}]
+    
+    return TextContent(type="text", text=orjson.dumps(result).decode())
+
+@mcp.tool()
+async def get_multi_team_injuries(teams: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Get current injury reports for several MLB teams at once.
+    
+    Args:
+        teams: Team keys (e.g., ['mets', 'dodgers', 'yankees'])
+    """
+    available_teams = _available_teams_set()
+    
+    async def fetch(team_key: str):
+        async with _multi_team_semaphore:
+            return (await _get_cache_entry(team_key))[2]
+    
+    team_keys = list(dict.fromkeys(team.lower() for team in teams))
+    valid_keys = [team_key for team_key in team_keys if team_key in available_teams]
+    results = await asyncio.gather(*(fetch(team_key) for team_key in valid_keys), return_exceptions=True)
+    scraped = dict(zip(valid_keys, results))
+    
+    response = {}
+    for team_key in team_keys:
+        if team_key not in scraped:
+            response[team_key] = [_unsupported_team_error(team_key)]
+            continue
+        
+        result = scraped[team_key]
+        if isinstance(result, BaseException):
+            logger.error("Error getting %s injuries: %s", team_key, result)
+            response[team_key] = [{"error": f"Failed to retrieve injury data for {team_key}: {str(result)}"}]
+        elif not result:
+            response[team_key] = [{"message": f"No injury data found for {team_key}"}]
+        else:
+            response[team_key] = list(result)
+    
+    logger.info("Retrieved injuries for %d of %d requested teams", len(scraped), len(team_keys))
+    return response
+
+@mcp.tool()
+async def get_mets_injuries() -> List[Dict[str, Any]]:
     """Get current New York Mets injury report with player details (legacy method)."""
-    return get_team_injuries('mets')
+    return await _team_injuries('mets')
 
 @mcp.tool()
 def get_available_teams() -> Dict[str, Any]:
     """Get list of all available MLB teams that can be queried."""
     try:
-        teams = scraper.get_available_teams()
-        team_info = {}
-        
-        for team_key in teams:
-            info = scraper.get_team_info(team_key)
-            if info:
-                team_info[team_key] = {
-                    "name": info.get('name', team_key),
-                    "abbreviation": info.get('abbreviation', team_key.upper())
-                }
-        
-        return {
-            "total_teams": len(teams),
-            "teams": team_info
-        }
+        return _teams_snapshot()
         
     except Exception as e:
-        logger.error(f"Error getting available teams: {e}")
+        logger.error("Error getting available teams: %s", e)
         return {"error": f"Failed to retrieve team list: {str(e)}"}
 
 @mcp.tool()
-def get_injury_summary(team: str = 'mets') -> Dict[str, Any]:
+async def get_injury_summary(team: str = 'mets') -> Dict[str, Any]:
     """Get a summary of team injuries including counts by status.
     
     Args:
         team: Team key (e.g., 'mets', 'dodgers', 'yankees'). Defaults to 'mets'.
     """
+    error = _unsupported_team_error(team)
+    if error:
+        return error
+    
     try:
-        injured_players = scraper.scrape_team_injuries(team.lower())
+        injured_players = await _get_players_cached(team.lower())
         
         total_injured = len(injured_players)
-        status_counts = {}
-        injury_types = {}
-        
-        for player in injured_players:
-            # Count by injury type
-            injury_type = player.injury
-            injury_types[injury_type] = injury_types.get(injury_type, 0) + 1
+        injury_types = Counter(player.injury for player in injured_players)
+        status_counts = Counter(player.status or 'Unknown' for player in injured_players)
         
         return {
             "total_injured_players": total_injured,
-            "injury_type_breakdown": injury_types,
+            "injury_type_breakdown": dict(injury_types),
+            "status_breakdown": dict(status_counts),
             "last_updated": "Real-time data from MLB.com"
         }
         
     except Exception as e:
-        logger.error(f"Error getting injury summary for {team}: {e}")
+        logger.error("Error getting injury summary for %s: %s", team, e)
         return {"error": f"Failed to retrieve injury summary for {team}: {str(e)}"}
 
 @mcp.tool()
-def search_player_injury(player_name: str, team: str = 'mets') -> Dict[str, Any]:
+async def search_player_injury(player_name: str, team: str = 'mets') -> Dict[str, Any]:
     """Search for a specific player's injury status.
     
     Args:
         player_name: Name of the player to search for
         team: Team key to search in (e.g., 'mets', 'dodgers', 'yankees'). Defaults to 'mets'.
     """
+    error = _unsupported_team_error(team)
+    if error:
+        return error
+    
     try:
-        injured_players = scraper.scrape_team_injuries(team.lower())
+        name_index = (await _get_cache_entry(team.lower()))[3]
         
-        # Search for player (case-insensitive)
+        # Search for player (case-insensitive): exact name, then substring, then fuzzy
         player_name_lower = player_name.lower()
-        for player in injured_players:
-            if player_name_lower in player.name.lower():
-                return {
-                    "found": True,
-                    "name": player.name,
-                    "position": player.position,
-                    "injury": player.injury,
-                    "il_date": player.il_date,
-                    "expected_return": player.expected_return,
-                    "status": player.status,
-                    "last_updated": player.last_updated
-                }
+        player = name_index.get(player_name_lower)
+        if player is None:
+            player = next(
+                (p for name, p in name_index.items() if player_name_lower in name),
+                None
+            )
+        if player is None and fuzz_process is not None:
+            match = fuzz_process.extractOne(player_name_lower, name_index.keys(), score_cutoff=FUZZY_SCORE_CUTOFF)
+            if match:
+                player = name_index[match[0]]
+        if player is not None:
+            return {
+                "found": True,
+                **player
+            }
         
         return {
             "found": False,
@@ -147,9 +422,38 @@ def search_player_injury(player_name: str, team: str = 'mets') -> Dict[str, Any]
         }
         
     except Exception as e:
-        logger.error(f"Error searching for player {player_name} on team {team}: {e}")
+        logger.error("Error searching for player %s on team %s: %s", player_name, team, e)
         return {"error": f"Failed to search for player: {str(e)}"}
 
+@mcp.tool()
+def invalidate_cache(team: Optional[str] = None) -> Dict[str, Any]:
+    """Discard cached injury data so the next query re-scrapes MLB.com.
+    
+    Args:
+        team: Team key to invalidate (e.g., 'mets'). Invalidates all teams if omitted.
+    """
+    if team is None:
+        with _CACHE_LOCK:
+            _CACHE.clear()
+        scraper.clear_cache()
+        return {"invalidated": "all"}
+    
+    error = _unsupported_team_error(team)
+    if error:
+        return error
+    
+    with _CACHE_LOCK:
+        _CACHE.pop(team.lower(), None)
+    scraper.clear_cache(team.lower())
+    return {"invalidated": team.lower()}
+
+def _run_mcp(**transport_kwargs):
+    """Run the MCP server, on uvloop when it is installed."""
+    # Same anyio entry point as mcp.run(); use_uvloop is only requested when the
+    # optional uvloop import succeeded
+    backend_options = {"use_uvloop": True} if uvloop is not None else {}
+    anyio.run(functools.partial(mcp.run_async, **transport_kwargs), backend_options=backend_options)
+
 def main():
     """Run the MCP server with configurable transport (stdio or HTTP/SSE)."""
     # Default values
@@ -171,12 +475,12 @@ def main():
     
     # Run MCP server with specified transport
     if transport == "sse":
-        logger.info(f"Starting MCP server with HTTP/SSE transport on {host}:{port}")
-        logger.info(f"MCP endpoint will be available at: http://{host}:{port}/sse")
-        mcp.run(transport="sse", host=host, port=port)
+        logger.info("Starting MCP server with HTTP/SSE transport on %s:%d", host, port)
+        logger.info("MCP endpoint will be available at: http://%s:%d/sse", host, port)
+        _run_mcp(transport="sse", host=host, port=port)
     else:
         logger.info("Starting MCP server with stdio transport")
-        mcp.run()
+        _run_mcp()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
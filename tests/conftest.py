@@ -0,0 +1,62 @@
+"""Shared fixtures for the MLB injury scraper tests."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+from scraper import InjuredPlayer
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+METS = [
+    InjuredPlayer("Dedniel Núñez", "RHP", "Right elbow sprain", status="Began a throwing program."),
+    InjuredPlayer("José Quintana", "LHP", "Left shoulder tightness", status="Threw a bullpen session."),
+]
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests response."""
+
+    def __init__(self, content: bytes = b"", status_code: int = 200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {"Content-Type": "text/html; charset=utf-8"}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class StubScrape:
+    """Stand-in for MLBInjuryScraper.fetch_team_injuries that records calls per team."""
+
+    def __init__(self, players=None, delay: float = 0.0):
+        self.players = players or {"mets": METS}
+        self.delay = delay
+        self.fail = False
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, team):
+        with self._lock:
+            self.calls.append(team)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("MLB.com unavailable")
+        return list(self.players.get(team, []))
+
+
+@pytest.fixture
+def mets_page() -> bytes:
+    """A saved Mets injury page with three injured players."""
+    return (FIXTURES_DIR / "mets_injuries.html").read_bytes()
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+    """Keep each test's requests-cache sqlite file out of the user cache directory."""
+    monkeypatch.setenv("MLB_INJURY_CACHE_PATH", str(tmp_path / "http_cache"))
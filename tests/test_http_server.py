@@ -0,0 +1,130 @@
+"""Tests for the HTTP API's caching, conditional responses and SSE fan-out."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import http_server
+from conftest import StubScrape
+from scraper import MLBInjuryScraper
+
+
+@pytest.fixture
+def scrapes(monkeypatch):
+    """Stub the scraper the app builds in its lifespan."""
+    stub = StubScrape()
+    monkeypatch.setattr(MLBInjuryScraper, "fetch_team_injuries", lambda self, team: stub(team))
+    http_server._injury_cache.clear()
+    http_server._response_cache.clear()
+    yield stub
+    http_server._injury_cache.clear()
+    http_server._response_cache.clear()
+
+
+@pytest.fixture
+def client(scrapes):
+    with TestClient(http_server.app) as test_client:
+        yield test_client
+
+
+def test_injuries_cached_with_etag_and_304(client, scrapes):
+    response = client.get("/api/teams/mets/injuries")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_injured"] == 2
+    assert [p["name"] for p in body["players"]] == ["Dedniel Núñez", "José Quintana"]
+
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    revalidated = client.get("/api/teams/mets/injuries", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert scrapes.calls == ["mets"]
+
+
+def test_failed_scrape_returns_502_no_store_and_is_not_cached(client, scrapes):
+    scrapes.fail = True
+    response = client.get("/api/teams/mets/injuries")
+    assert response.status_code == 502
+    assert response.headers["cache-control"] == "no-store"
+    assert "mets" not in http_server._injury_cache
+
+    scrapes.fail = False
+    assert client.get("/api/teams/mets/injuries").json()["total_injured"] == 2
+
+
+def test_unknown_team_is_404_without_scraping(client, scrapes):
+    assert client.get("/api/teams/nope/injuries").status_code == 404
+    assert client.get("/api/teams/nope/summary").status_code == 404
+    assert scrapes.calls == []
+
+
+def test_player_search(client, scrapes):
+    found = client.get("/api/teams/mets/players/quintana").json()
+    missing = client.get("/api/teams/mets/players/nobody").json()
+
+    assert found["found"] and found["player"]["name"] == "José Quintana"
+    assert missing["found"] is False
+    assert scrapes.calls == ["mets"]
+
+
+class _ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+
+def test_sse_fan_out_replays_latest_frame_to_late_subscribers(scrapes, monkeypatch):
+    state = http_server.app.state
+    monkeypatch.setattr(http_server, "scraper", MLBInjuryScraper(cache_ttl=0))
+    monkeypatch.setattr(state, "available_teams", frozenset({"mets"}), raising=False)
+    monkeypatch.setattr(state, "available_teams_csv", "mets", raising=False)
+    monkeypatch.setattr(state, "team_info", {"mets": {"name": "New York Mets"}}, raising=False)
+    monkeypatch.setattr(state, "executor", ThreadPoolExecutor(max_workers=2), raising=False)
+
+    async def two_clients():
+        first = (await http_server.stream_team_injuries(_ConnectedRequest(), "mets", 300)).body_iterator
+        first_frame = await asyncio.wait_for(first.__anext__(), timeout=5)
+
+        # The producer's next tick is 300s away, so this only arrives via the replay
+        second = (await http_server.stream_team_injuries(_ConnectedRequest(), "mets", 300)).body_iterator
+        second_frame = await asyncio.wait_for(second.__anext__(), timeout=1)
+
+        producers = dict(http_server._producers)
+        await first.aclose()
+        await second.aclose()
+        for task in producers.values():
+            task.cancel()
+        http_server._producers.clear()
+        http_server._subscribers.clear()
+        http_server._last_frame.clear()
+        return first_frame, second_frame, producers
+
+    first_frame, second_frame, producers = asyncio.run(two_clients())
+    state.executor.shutdown()
+
+    assert list(producers) == [("mets", 300)]
+    assert first_frame == second_frame
+    assert first_frame.startswith(b"event: injury_update\ndata: ")
+    payload = orjson.loads(first_frame.split(b"data: ", 1)[1])
+    assert payload["total_injured"] == 2
+    assert scrapes.calls == ["mets"]
+
+
+def test_shutdown_cancels_sse_producers(scrapes):
+    async def stream_then_shut_down():
+        async with http_server.lifespan(http_server.app):
+            stream = (await http_server.stream_team_injuries(_ConnectedRequest(), "mets", 300)).body_iterator
+            await asyncio.wait_for(stream.__anext__(), timeout=5)
+            producer = http_server._producers[("mets", 300)]
+        await stream.aclose()
+        return producer
+
+    producer = asyncio.run(stream_then_shut_down())
+
+    assert producer.cancelled()
+    assert not http_server._producers
+    assert not http_server._subscribers
+    assert not http_server._last_frame
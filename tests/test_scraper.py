@@ -0,0 +1,151 @@
+"""Tests for MLBInjuryScraper parsing, conditional GETs and error handling."""
+
+import io
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+import scraper as scraper_module
+from scraper import MLBInjuryScraper
+from conftest import FakeResponse
+
+EXPECTED_NAMES = ["Dedniel Núñez", "Luis Torrens", "José Quintana"]
+
+
+def _stub_get(scraper, responses, calls):
+    """Answer session.get from a list of responses, recording request headers."""
+    def get(url, timeout=None, headers=None):
+        calls.append(headers or {})
+        return responses.pop(0)
+    scraper.session.get = get
+
+
+@pytest.mark.parametrize("use_lexbor", [True, False])
+def test_parse_fixture_page(mets_page, monkeypatch, use_lexbor):
+    if use_lexbor and scraper_module.LexborHTMLParser is None:
+        pytest.skip("selectolax not installed")
+    if not use_lexbor:
+        monkeypatch.setattr(scraper_module, "LexborHTMLParser", None)
+
+    players = MLBInjuryScraper(cache_ttl=0)._parse_html(mets_page, "utf-8")
+
+    assert [p.name for p in players] == EXPECTED_NAMES
+    nunez = players[0]
+    assert nunez.position == "RHP"
+    assert nunez.injury == "Right elbow sprain"
+    assert nunez.il_date == "June 10 (15-day)"
+    assert nunez.expected_return == "August"
+    assert nunez.status == "Began a throwing program."
+    assert nunez.last_updated == "July 4"
+
+
+def test_not_modified_reuses_last_parse(mets_page):
+    scraper = MLBInjuryScraper(cache_ttl=0)
+    calls = []
+    _stub_get(scraper, [
+        FakeResponse(mets_page, headers={"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"'}),
+        FakeResponse(status_code=304),
+    ], calls)
+
+    first = scraper.fetch_team_injuries("mets")
+    second = scraper.fetch_team_injuries("mets")
+
+    assert calls[1].get("If-None-Match") == '"v1"'
+    assert [p.name for p in second] == [p.name for p in first]
+
+
+def test_cache_ttl_zero_refetches_every_scrape(mets_page):
+    scraper = MLBInjuryScraper(cache_ttl=0)
+    calls = []
+    _stub_get(scraper, [FakeResponse(mets_page), FakeResponse(mets_page)], calls)
+
+    scraper.fetch_team_injuries("mets")
+    scraper.fetch_team_injuries("mets")
+
+    assert len(calls) == 2
+
+
+class _PageAdapter(HTTPAdapter):
+    """Transport adapter that serves the current page body without touching the network."""
+
+    def __init__(self, page: bytes, headers):
+        super().__init__()
+        self.page = page
+        self.headers = headers
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        raw = HTTPResponse(body=io.BytesIO(self.page), headers=self.headers, status=200,
+                           preload_content=False)
+        return self.build_response(request, raw)
+
+
+def test_cache_ttl_zero_ignores_page_max_age(mets_page):
+    scraper = MLBInjuryScraper(cache_ttl=0)
+    adapter = _PageAdapter(mets_page, {"Content-Type": "text/html; charset=utf-8",
+                                       "Cache-Control": "max-age=600"})
+    scraper.session.mount("https://", adapter)
+
+    scraper.fetch_team_injuries("mets")
+    adapter.page = mets_page.replace(b"Right elbow sprain", b"Right elbow strain")
+    updated = scraper.fetch_team_injuries("mets")
+
+    assert adapter.sent == 2
+    assert updated[0].injury == "Right elbow strain"
+
+
+def test_parsed_results_reused_within_cache_ttl(mets_page):
+    scraper = MLBInjuryScraper(cache_ttl=600)
+    calls = []
+    _stub_get(scraper, [FakeResponse(mets_page)], calls)
+
+    scraper.fetch_team_injuries("mets")
+    scraper.fetch_team_injuries("mets")
+
+    assert len(calls) == 1
+
+
+def test_clear_cache_for_one_team_keeps_other_teams(mets_page):
+    scraper = MLBInjuryScraper(cache_ttl=600)
+    calls = []
+    _stub_get(scraper, [FakeResponse(mets_page) for _ in range(3)], calls)
+
+    scraper.fetch_team_injuries("mets")
+    scraper.fetch_team_injuries("yankees")
+    scraper.clear_cache("mets")
+    scraper.fetch_team_injuries("mets")
+    scraper.fetch_team_injuries("yankees")
+
+    assert len(calls) == 3
+
+
+def test_fetch_raises_and_scrape_returns_empty_on_error():
+    scraper = MLBInjuryScraper(cache_ttl=0)
+
+    def fail(*args, **kwargs):
+        raise requests.ConnectionError("down")
+    scraper.session.get = fail
+
+    with pytest.raises(requests.ConnectionError):
+        scraper.fetch_team_injuries("mets")
+    assert scraper.scrape_team_injuries("mets") == []
+
+
+def test_unknown_team():
+    scraper = MLBInjuryScraper(cache_ttl=0)
+
+    with pytest.raises(ValueError):
+        scraper.fetch_team_injuries("not-a-team")
+    assert scraper.scrape_team_injuries("not-a-team") == []
+
+
+def test_session_is_created_lazily(tmp_path):
+    scraper = MLBInjuryScraper(cache_ttl=0, cache_path=str(tmp_path / "lazy"))
+
+    assert scraper._session is None
+    scraper.clear_cache()
+    assert scraper._session is None
+    assert scraper.session is scraper.session
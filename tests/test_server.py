@@ -0,0 +1,151 @@
+"""Tests for the MCP server's caching, coalescing and tool behaviour."""
+
+import asyncio
+import json
+
+import pytest
+from fastmcp import Client
+
+import server
+from conftest import METS, StubScrape
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setenv(server.HOT_TEAMS_ENV_VAR, "")
+    server._CACHE.clear()
+    server._INFLIGHT.clear()
+    fake = StubScrape()
+    monkeypatch.setattr(server.scraper, "fetch_team_injuries", fake)
+    yield fake
+    server._CACHE.clear()
+    server._INFLIGHT.clear()
+
+
+async def _call(tool: str, **arguments):
+    """Call a tool through an in-memory MCP client and decode its JSON text."""
+    async with Client(server.mcp) as client:
+        result = await client.call_tool(tool, arguments)
+        return json.loads(result.content[0].text)
+
+
+def call(tool: str, **arguments):
+    return asyncio.run(_call(tool, **arguments))
+
+
+def test_team_injuries_cached_within_ttl(stub):
+    first = call("get_team_injuries", team="mets")
+    second = call("get_team_injuries", team="Mets")
+
+    assert [p["name"] for p in first] == ["Dedniel Núñez", "José Quintana"]
+    assert second == first
+    assert stub.calls == ["mets"]
+
+
+def test_failed_scrape_is_not_cached(stub):
+    stub.fail = True
+    result = call("get_team_injuries", team="mets")
+    assert "error" in result[0]
+    assert "mets" not in server._CACHE
+
+    stub.fail = False
+    assert len(call("get_team_injuries", team="mets")) == 2
+
+
+def test_stale_entry_served_while_refreshing(stub, monkeypatch):
+    call("get_team_injuries", team="mets")
+    monkeypatch.setattr(server, "_TTL", 0)
+    stub.players = {"mets": METS[:1]}
+
+    async def stale_then_refreshed():
+        stale = await server._get_cache_entry("mets")
+        await server._INFLIGHT["mets"]
+        return stale, server._CACHE["mets"]
+
+    stale, refreshed = asyncio.run(stale_then_refreshed())
+    assert len(stale[1]) == 2
+    assert len(refreshed[1]) == 1
+
+
+def test_failed_refresh_keeps_stale_entry(stub, monkeypatch):
+    call("get_team_injuries", team="mets")
+    monkeypatch.setattr(server, "_TTL", 0)
+    stub.fail = True
+
+    async def stale_read():
+        entry = await server._get_cache_entry("mets")
+        await asyncio.gather(server._INFLIGHT["mets"], return_exceptions=True)
+        return entry
+
+    entry = asyncio.run(stale_read())
+    assert len(entry[1]) == 2
+    assert server._CACHE["mets"] is entry
+
+
+def test_concurrent_misses_share_one_scrape(stub):
+    stub.delay = 0.1
+
+    async def burst():
+        return await asyncio.gather(*(server._get_cache_entry("mets") for _ in range(5)))
+
+    entries = asyncio.run(burst())
+    assert stub.calls == ["mets"]
+    assert all(entry is entries[0] for entry in entries)
+
+
+def test_unknown_team_rejected_before_scraping(stub):
+    assert "not supported" in call("get_team_injuries", team="nope")[0]["error"]
+    assert "not supported" in call("get_injury_summary", team="nope")["error"]
+    assert "not supported" in call("search_player_injury", player_name="x", team="nope")["error"]
+    assert stub.calls == []
+
+
+def test_injury_summary_counts(stub):
+    summary = call("get_injury_summary", team="mets")
+
+    assert summary["total_injured_players"] == 2
+    assert summary["injury_type_breakdown"] == {"Right elbow sprain": 1, "Left shoulder tightness": 1}
+    assert summary["status_breakdown"] == {"Began a throwing program.": 1, "Threw a bullpen session.": 1}
+
+
+def test_search_player_exact_and_substring(stub):
+    exact = call("search_player_injury", player_name="josé quintana", team="mets")
+    partial = call("search_player_injury", player_name="núñez", team="mets")
+    missing = call("search_player_injury", player_name="nobody", team="mets")
+
+    assert exact["found"] and exact["name"] == "José Quintana"
+    assert partial["found"] and partial["name"] == "Dedniel Núñez"
+    assert missing["found"] is False
+
+
+def test_search_player_fuzzy(stub):
+    pytest.importorskip("rapidfuzz")
+
+    result = call("search_player_injury", player_name="jose quintanna", team="mets")
+
+    assert result["found"] and result["name"] == "José Quintana"
+
+
+def test_multi_team_injuries(stub):
+    result = call("get_multi_team_injuries", teams=["mets", "Dodgers", "nope", "METS"])
+
+    assert list(result) == ["mets", "dodgers", "nope"]
+    assert len(result["mets"]) == 2
+    assert "message" in result["dodgers"][0]
+    assert result["nope"] == [server._unsupported_team_error("nope")]
+    assert "Available teams: mets" in result["nope"][0]["error"]
+    assert sorted(stub.calls) == ["dodgers", "mets"]
+
+
+def test_invalidate_cache_forces_rescrape(stub):
+    call("get_team_injuries", team="mets")
+    assert call("invalidate_cache", team="mets") == {"invalidated": "mets"}
+    call("get_team_injuries", team="mets")
+
+    assert stub.calls == ["mets", "mets"]
+    assert "not supported" in call("invalidate_cache", team="nope")["error"]
+
+
+def test_team_injuries_json_matches_structured_tool(stub):
+    assert call("get_team_injuries_json", team="mets") == call("get_team_injuries", team="mets")
+    assert stub.calls == ["mets"]